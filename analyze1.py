@@ -1,16 +1,69 @@
-import streamlit as st
-import pandas as pd
-import json
-from openai import AzureOpenAI
 import os
-azure_openai_key = os.getenv("AZURE_OPENAI_KEY")
+import json
+from io import BytesIO
+import streamlit as st
+
+
+# Created once per process and shared by every session and rerun
+@st.cache_resource
+def get_client():
+    # The OpenAI SDK is imported on first use rather than on every script run
+    from openai import AzureOpenAI
+
+    azure_openai_key = os.getenv("AZURE_OPENAI_KEY")
+
+    # Azure OpenAI client
+    return AzureOpenAI(
+        api_key=azure_openai_key,
+        azure_endpoint="https://cairo-hackathon-open-ai.openai.azure.com/",
+        api_version="2024-02-01"
+    )
+
+
+@st.cache_data(show_spinner=False)
+def read_excel(file_bytes):
+    import pandas as pd
+    return pd.read_excel(BytesIO(file_bytes))
+
+
+# --- Prompts ---
+SYSTEM_PROMPT = """
+You are a data analyst assistant. Your job is to:
+1. Analyze raw messy student Excel data.
+2. Extract clean structured data in JSON format under the key 'students',in column discount if the value is a string convert it to a number as a percentage.
+3. Generate any issues, alerts, or data quality suggestions under the key 'notes'.
+
+Respond ONLY in valid JSON like:
+{
+  "students": [ ... ],
+  "notes": [ "Issue 1", "Suggestion 2", ... ]
+}
+"""
+
+USER_PROMPT = """
+Analyze and clean the following raw data from Excel.
+Return JSON as described above.
+
+Raw data:
+{raw_data}
+"""
+
+
+# Keyed on the uploaded bytes, so paging through the preview neither rebuilds the
+# CSV prompt nor calls GPT again on rerun
+@st.cache_data(show_spinner=False)
+def analyze_with_gpt(file_bytes):
+    df = read_excel(file_bytes)
+    response = get_client().chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": USER_PROMPT.format(
+                raw_data=df.to_csv(index=False))}
+        ]
+    )
+    return response.choices[0].message.content.strip()
 
-# Azure OpenAI client
-client = AzureOpenAI(
-    api_key=azure_openai_key,
-    azure_endpoint="https://cairo-hackathon-open-ai.openai.azure.com/",
-    api_version="2024-02-01"
-)
 
 st.set_page_config(page_title="Student Data Analyzer", layout="wide")
 
@@ -20,43 +73,18 @@ st.write("Upload your messy student Excel file. The system will analyze, clean,
 uploaded_file = st.file_uploader("Upload Excel file", type=["xlsx"])
 
 if uploaded_file:
+    # pandas and the preview component are only needed once a file is uploaded
+    import pandas as pd
+    from data_preview import render_preview
+
     try:
-        df = pd.read_excel(uploaded_file)
+        df = read_excel(uploaded_file.getvalue())
         st.subheader("Preview of Raw Excel Data")
-        st.dataframe(df)
-
-        # Prompts
-        system_prompt = """
-        You are a data analyst assistant. Your job is to:
-        1. Analyze raw messy student Excel data.
-        2. Extract clean structured data in JSON format under the key 'students',in column discount if the value is a string convert it to a number as a percentage.
-        3. Generate any issues, alerts, or data quality suggestions under the key 'notes'.
-
-        Respond ONLY in valid JSON like:
-        {
-          "students": [ ... ],
-          "notes": [ "Issue 1", "Suggestion 2", ... ]
-        }
-        """
-
-        user_prompt = f"""
-        Analyze and clean the following raw data from Excel.
-        Return JSON as described above.
-
-        Raw data:
-        {df.to_csv(index=False)}
-        """
+        render_preview(df, key="raw")
 
         # Call GPT model
         with st.spinner(" Analyzing data with GPT..."):
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
-            result = response.choices[0].message.content.strip()
+            result = analyze_with_gpt(uploaded_file.getvalue())
 
         # Try to parse JSON
         try:
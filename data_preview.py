@@ -0,0 +1,106 @@
+import math
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# --- Preview Settings ---
+PAGE_SIZES = [25, 50, 100, 250]
+PREVIEW_MODES = ["Head", "Random sample"]
+
+
+@st.cache_data(show_spinner=False)
+def summarize_columns(df):
+    """
+    Builds per-column summary statistics (type, missing values, unique values, numeric range).
+    """
+    numeric = df.select_dtypes(include='number')
+    summary = pd.DataFrame({
+        'Type': df.dtypes.astype(str),
+        'Non-Null': df.notna().sum(),
+        'Missing': df.isna().sum(),
+        'Unique': df.nunique(),
+        'Min': numeric.min(),
+        'Max': numeric.max(),
+        'Mean': numeric.mean()
+    }, index=df.columns)
+    summary.index.name = 'Column'
+    return summary.reset_index()
+
+
+def get_preview_slice(df, mode, page, page_size, seed=0):
+    """
+    Returns only the rows that should be displayed for the given mode and page.
+    """
+    if mode == "Random sample":
+        size = min(page_size, len(df))
+        rng = np.random.default_rng(seed)
+        positions = np.sort(rng.choice(len(df), size=size, replace=False))
+        return df.iloc[positions]
+
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+def reset_page(page_key):
+    st.session_state[page_key] = 1
+
+
+def render_preview(df, key, title=None):
+    """
+    Renders a paginated preview of a dataframe with column selection and summary stats.
+    Only the visible slice is sent to the browser.
+    """
+    if title:
+        st.markdown(f"**{title}** ({len(df):,} rows × {len(df.columns)} columns)")
+
+    if df.empty:
+        st.info("No rows to display.")
+        return
+
+    mode_col, size_col, page_col = st.columns(3)
+    mode = mode_col.radio("Preview mode", PREVIEW_MODES,
+                          horizontal=True, key=f"{key}_mode")
+    page_key = f"{key}_page"
+    page_size = size_col.selectbox(
+        "Rows per page", PAGE_SIZES, key=f"{key}_page_size",
+        on_change=reset_page, args=(page_key,))
+
+    seed_key = f"{key}_sample_seed"
+    if mode == "Random sample":
+        page = 1
+        if page_col.button("Resample", key=f"{key}_resample"):
+            st.session_state[seed_key] = st.session_state.get(seed_key, 0) + 1
+    else:
+        total_pages = max(1, math.ceil(len(df) / page_size))
+        # A smaller frame (e.g. a new upload) can leave the stored page past the end
+        st.session_state[page_key] = min(
+            st.session_state.get(page_key, 1), total_pages)
+        page = page_col.number_input(
+            f"Page (of {total_pages})", min_value=1, max_value=total_pages, step=1, key=page_key)
+
+    all_columns = list(df.columns)
+    columns_key = f"{key}_columns"
+    # A new frame (e.g. a new upload) can leave a stored selection of columns it does not have
+    if columns_key not in st.session_state or not set(st.session_state[columns_key]).issubset(all_columns):
+        st.session_state[columns_key] = all_columns
+    selected_columns = st.multiselect("Columns", all_columns, key=columns_key)
+    if not selected_columns:
+        st.info("Select at least one column to preview.")
+        return
+
+    view = get_preview_slice(df, mode, int(page), page_size,
+                             seed=st.session_state.get(seed_key, 0))[selected_columns]
+    st.dataframe(view)
+
+    if mode == "Head":
+        start = (int(page) - 1) * page_size
+        st.caption(
+            f"Showing rows {start + 1:,}–{start + len(view):,} of {len(df):,}")
+    else:
+        st.caption(
+            f"Showing a random sample of {len(view):,} of {len(df):,} rows")
+
+    with st.expander("Column Summary"):
+        summary = summarize_columns(df)
+        st.dataframe(summary[summary['Column'].isin(selected_columns)],
+                     hide_index=True)
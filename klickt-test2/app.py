@@ -1,10 +1,10 @@
 import streamlit as st
-import pandas as pd
-from data_processor import process_file
 from io import BytesIO
 
 
 def to_excel(dfs):
+    import pandas as pd
+
     output = BytesIO()
     with pd.ExcelWriter(output, engine='openpyxl') as writer:
         for name, df in dfs.items():
@@ -13,6 +13,13 @@ def to_excel(dfs):
     return processed_data
 
 
+@st.cache_data(show_spinner=False)
+def read_excel(file_bytes, engine):
+    # pandas and the Excel engines are imported on first upload, not at startup
+    import pandas as pd
+    return pd.read_excel(BytesIO(file_bytes), engine=engine)
+
+
 def main():
     st.set_page_config(
         layout="wide", page_title="School Data Onboarding AI Assistant")
@@ -27,7 +34,7 @@ def main():
     2.  The assistant will display the original data.
     3.  Click the "Process File" button.
     4.  The assistant will analyze the data, structure it into Parent, Student, and Payment sheets, and display the results.
-    5.  Review the notifications for important information about the process.
+    5.  Review the notifications and the data quality report for important information about the process.
     6.  Download the processed data as a new Excel file.
     """)
 
@@ -35,11 +42,21 @@ def main():
         "Upload an Excel file", type=["xls", "xlsx"])
 
     if uploaded_file is not None:
+        # The processing modules pull in pandas/numpy, so they load with the first upload
+        from data_processor import process_file
+        from data_validator import validate_sheets
+        from data_preview import render_preview
+
+        # Results are kept across reruns so paging through previews does not reprocess the file
+        file_key = uploaded_file.file_id
+        if st.session_state.get('processed_file_key') != file_key:
+            st.session_state.pop('processed_results', None)
+
         with st.expander("View Original Data"):
             try:
-                df = pd.read_excel(
-                    uploaded_file, engine='openpyxl' if uploaded_file.name.endswith('xlsx') else 'xlrd')
-                st.dataframe(df)
+                df = read_excel(
+                    uploaded_file.getvalue(), 'openpyxl' if uploaded_file.name.endswith('xlsx') else 'xlrd')
+                render_preview(df, key="original")
             except Exception as e:
                 st.error(
                     f"An error occurred while reading the Excel file: {e}")
@@ -51,46 +68,61 @@ def main():
                     parent_df, student_df, payment_df, notifications = process_file(
                         df)
 
-                    st.subheader("Processed Data")
-
-                    with st.expander("Parent Data", expanded=True):
-                        st.dataframe(parent_df)
-
-                    with st.expander("Student Data", expanded=True):
-                        st.dataframe(student_df)
-
-                    with st.expander("Payment Data", expanded=True):
-                        st.dataframe(payment_df)
-
-                    st.subheader("Notifications & Warnings")
-                    info_notifications = [
-                        n for n in notifications if "Warning:" not in n]
-                    warning_notifications = [
-                        n for n in notifications if "Warning:" in n]
-
-                    for notification in info_notifications:
-                        st.info(notification)
-
-                    for notification in warning_notifications:
-                        st.warning(notification)
-
-                    # --- Download Button ---
                     processed_dfs = {
                         "Parent": parent_df,
                         "Student": student_df,
                         "Payment": payment_df
                     }
-                    excel_data = to_excel(processed_dfs)
-                    st.download_button(
-                        label="📥 Download Processed Excel File",
-                        data=excel_data,
-                        file_name="processed_school_data.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    )
+                    st.session_state['processed_results'] = {
+                        'dfs': processed_dfs,
+                        'notifications': notifications,
+                        'validation_report': validate_sheets(processed_dfs),
+                        'excel_data': to_excel(processed_dfs)
+                    }
+                    st.session_state['processed_file_key'] = file_key
 
                 except Exception as e:
                     st.error(f"An error occurred during processing: {e}")
 
+        if 'processed_results' in st.session_state:
+            results = st.session_state['processed_results']
+
+            st.subheader("Processed Data")
+
+            for name, processed_df in results['dfs'].items():
+                with st.expander(f"{name} Data", expanded=True):
+                    render_preview(processed_df, key=name.lower())
+
+            st.subheader("Notifications & Warnings")
+            notifications = results['notifications']
+            info_notifications = [
+                n for n in notifications if "Warning:" not in n]
+            warning_notifications = [
+                n for n in notifications if "Warning:" in n]
+
+            for notification in info_notifications:
+                st.info(notification)
+
+            for notification in warning_notifications:
+                st.warning(notification)
+
+            # --- Data Quality Report ---
+            st.subheader("Data Quality Report")
+            validation_report = results['validation_report']
+            if validation_report.empty:
+                st.success("No data quality issues found.")
+            else:
+                st.dataframe(validation_report,
+                             hide_index=True, use_container_width=True)
+
+            # --- Download Button ---
+            st.download_button(
+                label="📥 Download Processed Excel File",
+                data=results['excel_data'],
+                file_name="processed_school_data.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+# --- Profiling Settings ---
+PROFILE_SAMPLE_SIZE = 500
+PROFILE_MIN_MATCH_RATIO = 0.8
+PROFILE_RANDOM_SEED = 42
+
+# Roles whose values are expected to be (mostly) unique per row
+ROLE_MIN_UNIQUE_RATIO = {
+    'composite_id': 0.9,
+    'id': 0.9,
+    'name': 0.5
+}
+
+# --- Value Patterns (checked in priority order) ---
+AMOUNT_NUMBER = r'(?:\d{1,3}(?:,\d{3})+|\d+)'
+CURRENCY_SYMBOL = r'[$€£]'
+CURRENCY_CODE = r'[A-Za-z]{3}'
+PHONE_NUMBER = r'\+?\(?\d[\d\s\-()]{7,18}\d'
+
+ROLE_PATTERNS = {
+    'email': r'[^@\s]+@[^@\s]+\.[^@\s]+',
+    'composite_id': r'[A-Za-z0-9\-]+\s*/\s*[A-Za-z0-9\-]+',
+    'date': r'\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}(?:[ T]\d{1,2}:\d{2}(?::\d{2})?)?',
+    # Bare digit runs are usually student or account numbers, so a phone also needs
+    # a leading '+' or '0', or separators between the digits
+    'phone': rf'(?={PHONE_NUMBER}$)(?:\+|0|\(|\d+[\s\-)]).*',
+    'id': r'[A-Za-z]{0,5}[-_#]?\d{1,12}',
+    # Bare integers are too ambiguous (grades, years, counts), so money needs a
+    # currency marker, a thousands separator or decimals
+    'money': rf'{CURRENCY_SYMBOL}\s*{AMOUNT_NUMBER}(?:\.\d{{1,2}})?(?:\s*{CURRENCY_CODE})?'
+             rf'|{AMOUNT_NUMBER}(?:\.\d{{1,2}})?\s*(?:{CURRENCY_CODE}|{CURRENCY_SYMBOL})'
+             rf'|{CURRENCY_CODE}\s*{AMOUNT_NUMBER}(?:\.\d{{1,2}})?'
+             r'|\d{1,3}(?:,\d{3})+(?:\.\d{1,2})?'
+             r'|\d+\.\d{1,2}',
+    'name': r"[^\W\d_]+(?:[\s.'\-]+[^\W\d_]+){0,4}\.?"
+}
+
+# Accepts the same currency symbols and codes as the money role, with or without them
+AMOUNT_PATTERN = (rf'^(?:{CURRENCY_CODE}\s*)?{CURRENCY_SYMBOL}?\s*(?P<whole>{AMOUNT_NUMBER})(?P<fraction>\.\d+)?'
+                  rf'\s*(?:{CURRENCY_CODE}|{CURRENCY_SYMBOL})?$')
+
+
+def sample_rows(df, sample_size=PROFILE_SAMPLE_SIZE, seed=PROFILE_RANDOM_SEED):
+    """
+    Returns a bounded random sample of rows, drawn without scanning the frame.
+    """
+    if len(df) <= sample_size:
+        return df
+
+    # Drawing positions with replacement keeps the cost independent of len(df)
+    rng = np.random.default_rng(seed)
+    positions = np.unique(rng.integers(0, len(df), size=sample_size))
+    return df.iloc[positions]
+
+
+def values_as_text(values):
+    """
+    Converts column values to stripped strings, dropping the '.0' Excel adds to whole numbers.
+    """
+    if pd.api.types.is_float_dtype(values) and (values % 1 == 0).all():
+        values = values.astype('int64')
+    return values.astype(str).str.strip()
+
+
+def parse_amounts(values):
+    """
+    Converts money-like values ("$136", "1,500 SAR", "EGP 980", 1500.0) to numbers.
+    Values that are not a plain or currency-marked amount become NaN.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return pd.to_numeric(values, errors='coerce')
+
+    parts = values_as_text(values).str.extract(AMOUNT_PATTERN)
+    number = parts['whole'].str.replace(',', '', regex=False) + parts['fraction'].fillna('')
+    return pd.to_numeric(number, errors='coerce')
+
+
+def classify_values(values):
+    """
+    Classifies a sample of non-null column values into a role, or returns None.
+    """
+    if values.empty:
+        return None
+
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return 'date'
+
+    text = values_as_text(values)
+    text = text[text != '']
+    if text.empty:
+        return None
+
+    unique_ratio = text.nunique() / len(text)
+
+    for role, pattern in ROLE_PATTERNS.items():
+        if unique_ratio < ROLE_MIN_UNIQUE_RATIO.get(role, 0):
+            continue
+        if text.str.fullmatch(pattern).mean() >= PROFILE_MIN_MATCH_RATIO:
+            return role
+    return None
+
+
+def profile_columns(df, columns=None, sample_size=PROFILE_SAMPLE_SIZE):
+    """
+    Infers the role of each column (phone, email, id, composite_id, money, date, name)
+    from a random sample of its values. Only the given columns are profiled (all by
+    default) and unclassified columns are left out.
+    """
+    # Sampling before selecting columns avoids copying the whole frame
+    sample = sample_rows(df, sample_size)
+    if columns is None:
+        columns = sample.columns
+
+    profile = {}
+    for col in columns:
+        role = classify_values(sample[col].dropna())
+        if role is not None:
+            profile[col] = role
+    return profile
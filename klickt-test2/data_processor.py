@@ -3,6 +3,7 @@ import re
 import random
 import string
 import numpy as np
+from column_profiler import profile_columns
 
 # --- Column Keywords ---
 PARENT_KEYWORDS = {
@@ -33,33 +34,97 @@ PAYMENT_KEYWORDS = {
     'dueDate': ['due date', 'deadline']
 }
 
+# --- Compiled Patterns ---
+HEADER_SEPARATOR_RE = re.compile(r'[\s_]')
+INSTALLMENT_COLUMN_RE = re.compile(
+    r'(installment|term|q)\s*\d+', re.IGNORECASE)
 
-def find_column_mapping(df_columns, keywords):
+
+def normalize_header(header):
+    """
+    Normalizes a header for matching (case-insensitive, ignores spaces and underscores).
+    """
+    return HEADER_SEPARATOR_RE.sub('', str(header)).lower()
+
+
+def compile_keywords(keywords):
+    """
+    Normalizes every keyword of a keyword table once, at import time.
+    """
+    return {target_col: [normalize_header(key) for key in keys]
+            for target_col, keys in keywords.items()}
+
+
+PARENT_KEYWORD_TABLE = compile_keywords(PARENT_KEYWORDS)
+STUDENT_KEYWORD_TABLE = compile_keywords(STUDENT_KEYWORDS)
+PAYMENT_KEYWORD_TABLE = compile_keywords(PAYMENT_KEYWORDS)
+
+
+# --- Value-Profile Fallback Roles ---
+PARENT_PROFILE_ROLES = {
+    'Phone': 'phone',
+    'Email': 'email'
+}
+
+STUDENT_PROFILE_ROLES = {
+    'StudentID': 'id',
+    'Name': 'name',
+    'Deadline': 'date'
+}
+
+PAYMENT_PROFILE_ROLES = {
+    'Amount': 'money',
+    'dueDate': 'date'
+}
+
+
+def find_column_mapping(df_columns, keywords, keyword_table=None):
     """
     Finds the best mapping from dataframe columns to keyword-defined columns.
+    Pass the precompiled keyword_table for keywords to skip compiling it on every call.
     """
     mapping = {}
-    unmapped_columns = list(df_columns)
+    if keyword_table is None:
+        keyword_table = compile_keywords(keywords)
+    # Each header is normalized once instead of once per keyword
+    unmapped_columns = {col: normalize_header(col) for col in df_columns}
 
-    for target_col, keys in keywords.items():
+    for target_col, keys in keyword_table.items():
         for key in keys:
-            for col in unmapped_columns:
-                # Simple matching (case-insensitive, ignores spaces and underscores)
-                if re.sub(r'[\s_]', '', col).lower() == re.sub(r'[\s_]', '', key).lower():
-                    mapping[target_col] = col
-                    unmapped_columns.remove(col)
-                    break
-            if target_col in mapping:
+            col = next((col for col, header in unmapped_columns.items()
+                        if header == key), None)
+            if col is not None:
+                mapping[target_col] = col
+                del unmapped_columns[col]
                 break
     return mapping
 
 
+def apply_profile_fallback(mapping, column_profile, profile_roles, claimed_columns):
+    """
+    Maps still-unmapped target columns using the roles inferred from column values.
+    """
+    fallback_mapping = {}
+    taken = set(claimed_columns) | set(mapping.values())
+
+    for target_col, role in profile_roles.items():
+        if target_col in mapping:
+            continue
+        for col, col_role in column_profile.items():
+            if col_role == role and col not in taken:
+                mapping[target_col] = col
+                fallback_mapping[target_col] = col
+                taken.add(col)
+                break
+    return fallback_mapping
+
+
 def extract_installment_payments(df, payment_schema, notifications):
     """
     Finds and extracts installment payments from columns.
     """
-    installment_cols = [col for col in df.columns if re.match(
-        r'(installment|term|q)\s*\d+', col, re.IGNORECASE)]
+    installment_cols = [
+        col for col in df.columns if INSTALLMENT_COLUMN_RE.match(str(col))]
 
     if not installment_cols:
         return []
@@ -103,14 +168,17 @@ def extract_installment_payments(df, payment_schema, notifications):
     return installment_cols
 
 
-def handle_combined_id_column(df, student_mapping, notifications):
+def handle_combined_id_column(df, student_mapping, notifications, column_profile=None):
     """
     Checks for and handles a combined parent/student ID column.
     """
+    column_profile = column_profile or {}
+
     # Attempt to find a combined ID column if standard IDs are not mapped
     if 'parentid' not in student_mapping and 'StudentID' not in student_mapping:
         for col in df.columns:
-            if 'id' in col.lower() and df[col].astype(str).str.contains('/').any():
+            if column_profile.get(col) == 'composite_id' or (
+                    'id' in str(col).lower() and df[col].astype(str).str.contains('/').any()):
                 notifications.append(
                     f"Found a combined ID column: '{col}'. Splitting into Parent and Student IDs.")
 
@@ -142,13 +210,34 @@ def process_file(df):
     df_main = df.drop(columns=processed_payment_cols)
 
     # --- Column Mapping ---
-    parent_mapping = find_column_mapping(df_main.columns, PARENT_KEYWORDS)
-    student_mapping = find_column_mapping(df_main.columns, STUDENT_KEYWORDS)
-    payment_mapping = find_column_mapping(df_main.columns, PAYMENT_KEYWORDS)
+    parent_mapping = find_column_mapping(
+        df_main.columns, PARENT_KEYWORDS, PARENT_KEYWORD_TABLE)
+    student_mapping = find_column_mapping(
+        df_main.columns, STUDENT_KEYWORDS, STUDENT_KEYWORD_TABLE)
+    payment_mapping = find_column_mapping(
+        df_main.columns, PAYMENT_KEYWORDS, PAYMENT_KEYWORD_TABLE)
+
+    header_mapped_columns = set(parent_mapping.values()) | set(
+        student_mapping.values()) | set(payment_mapping.values())
+
+    # --- Profile column values for headers that did not match ---
+    column_profile = profile_columns(
+        df_main, [col for col in df_main.columns if col not in header_mapped_columns])
 
     # --- Handle Combined ID Column ---
     df_main = handle_combined_id_column(
-        df_main, student_mapping, notifications)
+        df_main, student_mapping, notifications, column_profile)
+
+    # --- Value-Profile Fallback Mapping ---
+    for schema_name, mapping, profile_roles in [('Parent', parent_mapping, PARENT_PROFILE_ROLES),
+                                                ('Student', student_mapping,
+                                                 STUDENT_PROFILE_ROLES),
+                                                ('Payment', payment_mapping, PAYMENT_PROFILE_ROLES)]:
+        fallback_mapping = apply_profile_fallback(
+            mapping, column_profile, profile_roles, header_mapped_columns)
+        for target_col, col in fallback_mapping.items():
+            notifications.append(
+                f"Mapped '{col}' to '{target_col}' in the {schema_name} data based on its values ({column_profile[col]}-like).")
 
     notifications.append(f"Parent column mapping: {parent_mapping}")
     notifications.append(f"Student column mapping: {student_mapping}")
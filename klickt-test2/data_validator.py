@@ -0,0 +1,117 @@
+import re
+import pandas as pd
+from column_profiler import PHONE_NUMBER, ROLE_PATTERNS, parse_amounts, values_as_text
+
+# --- Report Settings ---
+REPORT_SAMPLE_ROWS = 5
+REPORT_COLUMNS = ['Sheet', 'Column', 'Rule', 'Count', 'Sample Excel Rows']
+
+# --- Date Settings ---
+# Day-first matches how the schools we onboard write dates (05/03/2024 is 5 March)
+DATE_DAYFIRST = True
+# Excel stores dates as day serials; accept 1970-01-01 through 2099-12-31
+EXCEL_SERIAL_RANGE = (25569, 73050)
+
+# --- Compiled Patterns ---
+PHONE_RE = re.compile(PHONE_NUMBER)
+EMAIL_RE = re.compile(ROLE_PATTERNS['email'])
+GRADE_RE = re.compile(
+    r'(?:(?:grade|class|g|kg|year|primary|secondary|prep)\s*[-_]?\s*)?'
+    r'\d{1,2}(?:st|nd|rd|th)?\s*[A-Za-z]?(?:\s*grade)?|kg|pre-?k|nursery',
+    re.IGNORECASE)
+
+
+# --- Rule Checks ---
+# Each check takes the non-null values of a column and returns a boolean mask of offending rows.
+
+def invalid_pattern(pattern):
+    def check(values):
+        return ~values_as_text(values).str.fullmatch(pattern)
+    return check
+
+
+def invalid_date(values):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return pd.Series(False, index=values.index)
+
+    serials = pd.to_numeric(values, errors='coerce')
+    is_serial = serials.notna()
+    invalid = ~serials.between(*EXCEL_SERIAL_RANGE)
+
+    # Text dates are parsed one by one, since messy files mix formats within a column
+    text = values[~is_serial]
+    if not text.empty:
+        invalid.loc[text.index] = pd.to_datetime(
+            text.astype(str), format='mixed', dayfirst=DATE_DAYFIRST, errors='coerce').isna().to_numpy()
+    return invalid
+
+
+def invalid_amount(values):
+    amounts = parse_amounts(values)
+    return amounts.isna() | (amounts <= 0)
+
+
+VALIDATION_RULES = {
+    'Parent': [
+        ('Parent ID', 'Missing value', None),
+        ('Phone', 'Invalid phone number', invalid_pattern(PHONE_RE)),
+        ('Email', 'Invalid email address', invalid_pattern(EMAIL_RE))
+    ],
+    'Student': [
+        ('StudentID', 'Missing value', None),
+        ('Name', 'Missing value', None),
+        ('grade', 'Unrecognized grade', invalid_pattern(GRADE_RE)),
+        ('Deadline', 'Unparseable due date', invalid_date)
+    ],
+    'Payment': [
+        ('Amount', 'Non-numeric or non-positive amount', invalid_amount),
+        ('dueDate', 'Unparseable due date', invalid_date)
+    ]
+}
+
+
+def find_offending_rows(column, check):
+    """
+    Returns a boolean mask over the whole column marking rows that break a rule.
+    A rule without a check flags missing values.
+    """
+    missing = column.isna()
+    if check is None:
+        return missing
+
+    present = column[~missing]
+    offending = pd.Series(False, index=column.index)
+    if not present.empty:
+        offending.loc[present.index] = check(present).to_numpy()
+    return offending
+
+
+def validate_sheets(sheets, sample_rows=REPORT_SAMPLE_ROWS):
+    """
+    Runs the validation rules over each processed sheet and returns an aggregated
+    report with one row per failing rule: its count and a few sample row numbers as they
+    appear in the downloaded Excel sheet (header on row 1).
+    """
+    findings = []
+    for sheet_name, df in sheets.items():
+        for column_name, rule_name, check in VALIDATION_RULES.get(sheet_name, []):
+            # Unmapped columns are entirely empty and already reported by process_file
+            if column_name not in df.columns or df[column_name].isna().all():
+                continue
+
+            offending = find_offending_rows(
+                df[column_name].reset_index(drop=True), check)
+            count = int(offending.sum())
+            if count == 0:
+                continue
+
+            findings.append({
+                'Sheet': sheet_name,
+                'Column': column_name,
+                'Rule': rule_name,
+                'Count': count,
+                'Sample Excel Rows': ', '.join(
+                    str(position + 2) for position in offending.index[offending.to_numpy()][:sample_rows])
+            })
+
+    return pd.DataFrame(findings, columns=REPORT_COLUMNS)
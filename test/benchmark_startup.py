@@ -0,0 +1,118 @@
+"""
+Startup and rerun latency benchmark for the Streamlit apps.
+
+Each app is started in a fresh interpreter. "Cold start" is measured from spawning the
+interpreter through the end of the first script run, so it includes every module import.
+The app is then rerun a few times in the same process like Streamlit does on widget
+interaction. For klickt-test2/app.py the benchmark also uploads test/student_sample.xlsx
+and clicks "Process File". The GPT apps are only measured without an upload, since an
+upload sends the file to Azure OpenAI.
+
+Pass another checkout to compare against it (e.g. a git worktree of the baseline):
+
+    python test/benchmark_startup.py
+    python test/benchmark_startup.py --root /tmp/baseline
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FILE = os.path.join(ROOT, 'test', 'student_sample.xlsx')
+XLSX_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+APPS = [
+    ('klickt-test2/app.py', True),
+    ('analyze_new.py', False),
+    ('analyze1.py', False),
+]
+
+COLD_STARTS = 5
+RERUNS = 10
+
+
+def time_call(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def measure_app(app_path, with_upload):
+    """
+    Runs inside a child interpreter: times the first script run, the following reruns
+    and optionally an upload plus processing, and prints them as JSON.
+    """
+    os.chdir(os.path.dirname(app_path))
+    sys.path.insert(0, os.path.dirname(app_path))
+
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(app_path, default_timeout=120)
+    app.run()
+    first_run_end = time.time()
+    pandas_loaded = 'pandas' in sys.modules
+
+    reruns = [time_call(app.run) for _ in range(RERUNS)]
+
+    result = {
+        'first_run_end': first_run_end,
+        'rerun': statistics.median(reruns),
+        'pandas_after_first_run': pandas_loaded,
+    }
+
+    if with_upload:
+        with open(SAMPLE_FILE, 'rb') as f:
+            sample = f.read()
+        app.file_uploader[0].set_value(('student_sample.xlsx', sample, XLSX_MIME))
+        result['upload'] = time_call(app.run)
+        process_button = next(b for b in app.button if b.label == "Process File")
+        result['process'] = time_call(process_button.click().run)
+        result['upload_rerun'] = statistics.median(
+            time_call(app.run) for _ in range(RERUNS))
+
+    result['exceptions'] = [str(e.value) for e in app.exception]
+    print(json.dumps(result))
+
+
+def run_cold_start(app_path, with_upload):
+    # Dummy keys let clients that are built at import time start without real credentials
+    env = {'GKEY': 'benchmark', 'AZURE_OPENAI_KEY': 'benchmark', **os.environ}
+    spawned = time.time()
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', app_path, str(with_upload)],
+        capture_output=True, text=True, check=True, env=env)
+    sample = json.loads(result.stdout.strip().splitlines()[-1])
+    sample['cold_start'] = sample['first_run_end'] - spawned
+    return sample
+
+
+def median_ms(samples, name):
+    values = [s[name] for s in samples if name in s]
+    return f"{statistics.median(values) * 1000:.0f}" if values else '-'
+
+
+def main(root):
+    print(f"Benchmarking {root}")
+    print(f"{'App':<22}{'cold start':>12}{'rerun':>8}{'upload':>8}"
+          f"{'process':>9}{'rerun after':>13}  pandas at start")
+    for app_name, with_upload in APPS:
+        app_path = os.path.join(root, app_name)
+        samples = [run_cold_start(app_path, with_upload) for _ in range(COLD_STARTS)]
+        print(f"{app_name:<22}{median_ms(samples, 'cold_start'):>12}{median_ms(samples, 'rerun'):>8}"
+              f"{median_ms(samples, 'upload'):>8}{median_ms(samples, 'process'):>9}"
+              f"{median_ms(samples, 'upload_rerun'):>13}  {samples[-1]['pandas_after_first_run']}")
+        for error in samples[-1]['exceptions']:
+            print(f"  Warning: {app_name} raised: {error}")
+    print("All times are medians in milliseconds.")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        measure_app(sys.argv[2], sys.argv[3] == 'True')
+    elif len(sys.argv) == 3 and sys.argv[1] == '--root':
+        main(os.path.abspath(sys.argv[2]))
+    else:
+        main(ROOT)
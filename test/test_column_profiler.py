@@ -0,0 +1,104 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'klickt-test2'))
+
+from column_profiler import PROFILE_SAMPLE_SIZE, profile_columns, sample_rows  # noqa: E402
+from data_processor import process_file  # noqa: E402
+
+ROWS = 60
+
+
+def make_frame(rows=ROWS):
+    return pd.DataFrame({
+        'Column1': [f'0100{i:07d}' for i in range(rows)],
+        'Column2': [f'parent{i}@school.com' for i in range(rows)],
+        'Column3': [f'P{i}/S{i}' for i in range(rows)],
+        'Column4': [f'S-{1000 + i}' for i in range(rows)],
+        'Column5': [f'${100 + i * 10}' for i in range(rows)],
+        'Column6': [f'Student Name{chr(97 + i % 26)}{chr(97 + i // 26)}' for i in range(rows)],
+        'Column7': pd.date_range('2024-01-01', periods=rows),
+    })
+
+
+def test_profile_columns_detects_roles():
+    assert profile_columns(make_frame()) == {
+        'Column1': 'phone',
+        'Column2': 'email',
+        'Column3': 'composite_id',
+        'Column4': 'id',
+        'Column5': 'money',
+        'Column6': 'name',
+        'Column7': 'date',
+    }
+
+
+def test_profile_columns_accepts_formatted_amounts():
+    df = pd.DataFrame({
+        'Fees': ['1,500 SAR', '2,250.50', '$136', '980 EGP'] * 10,
+        'Balance': [1500.25, 320.5, 99.99, 1200.75] * 10,
+    })
+    assert profile_columns(df) == {'Fees': 'money', 'Balance': 'money'}
+
+
+def test_profile_columns_ignores_repeating_codes_and_bare_integers():
+    df = pd.DataFrame({
+        'Class': ['3/A', '10/B', '3/B', '10/A'] * 15,
+        'Period': ['05/2024', '06/2024', '07/2024'] * 20,
+        'Grade': [1, 2, 3, 4, 5, 6] * 10,
+        'Year': [2023, 2024] * 30,
+    })
+    assert profile_columns(df) == {}
+
+
+def test_profile_columns_treats_bare_digit_runs_as_ids():
+    df = pd.DataFrame({
+        'Column1': [1100000001 + i for i in range(ROWS)],
+        'Column2': [f'+20 100 {i:07d}' for i in range(ROWS)],
+    })
+    assert profile_columns(df) == {'Column1': 'id', 'Column2': 'phone'}
+
+
+def test_process_file_maps_student_numbers_to_student_id():
+    df = pd.DataFrame({
+        'Student Name': [f'Student {i}' for i in range(ROWS)],
+        'Column1': [1100000001 + i for i in range(ROWS)],
+    })
+    parent_df, student_df, _, _ = process_file(df)
+    assert student_df['StudentID'].tolist() == df['Column1'].tolist()
+    assert parent_df['Phone'].isna().all()
+
+
+def test_profile_columns_only_profiles_requested_columns():
+    assert profile_columns(make_frame(), ['Column2', 'Column5']) == {
+        'Column2': 'email',
+        'Column5': 'money',
+    }
+
+
+def test_sample_rows_is_bounded():
+    df = pd.DataFrame({'value': range(1_000_000)})
+    assert len(sample_rows(df)) <= PROFILE_SAMPLE_SIZE
+    assert len(sample_rows(df.head(100))) == 100
+
+
+def test_profile_columns_is_stable_across_row_counts():
+    small = make_frame()
+    large = pd.concat([small] * 5000, ignore_index=True)
+    # Repeated rows lower uniqueness, so only compare roles without a uniqueness floor
+    unaffected = ['Column1', 'Column2', 'Column5', 'Column7']
+    assert {col: profile_columns(large).get(col) for col in unaffected} == \
+        {col: profile_columns(small)[col] for col in unaffected}
+
+
+def test_process_file_does_not_split_class_sections():
+    df = pd.DataFrame({
+        'Student Name': [f'Student {i}' for i in range(ROWS)],
+        'Section': ['3/A', '10/B', '3/B', '10/A'] * (ROWS // 4),
+    })
+    _, student_df, _, notifications = process_file(df)
+    assert not any('combined ID' in n for n in notifications)
+    assert len(student_df) == ROWS
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The root apps and klickt-test2 are deployed separately and each ship a copy of the module
+PREVIEW_MODULES = [
+    os.path.join(ROOT, 'data_preview.py'),
+    os.path.join(ROOT, 'klickt-test2', 'data_preview.py'),
+]
+
+SCRIPT = '''
+import importlib.util
+import pandas as pd
+import streamlit as st
+
+spec = importlib.util.spec_from_file_location("data_preview_under_test", {module_path!r})
+data_preview = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(data_preview)
+
+rows = st.session_state.get("rows", 10000)
+columns = st.session_state.get("columns", ["a", "b"])
+data_preview.render_preview(
+    pd.DataFrame({{column: range(rows) for column in columns}}), key="preview")
+'''
+
+
+def start_app(module_path):
+    return AppTest.from_string(SCRIPT.format(module_path=module_path), default_timeout=30).run()
+
+
+def test_preview_copies_are_identical():
+    sources = [open(path, encoding='utf-8').read() for path in PREVIEW_MODULES]
+    assert sources[0] == sources[1]
+
+
+@pytest.mark.parametrize('module_path', PREVIEW_MODULES)
+def test_page_resets_when_page_size_changes(module_path):
+    app = start_app(module_path)
+    app.number_input(key="preview_page").set_value(40).run()
+    app.selectbox(key="preview_page_size").set_value(250).run()
+
+    assert not app.exception
+    assert app.number_input(key="preview_page").value == 1
+    assert app.caption[0].value == "Showing rows 1–250 of 10,000"
+
+
+@pytest.mark.parametrize('module_path', PREVIEW_MODULES)
+def test_page_is_clamped_when_frame_shrinks(module_path):
+    app = start_app(module_path)
+    app.number_input(key="preview_page").set_value(40).run()
+    app.session_state["rows"] = 300
+    app.run()
+
+    assert not app.exception
+    assert app.caption[0].value == "Showing rows 276–300 of 300"
+
+
+@pytest.mark.parametrize('module_path', PREVIEW_MODULES)
+@pytest.mark.parametrize('new_columns', [["a", "x", "y"], ["x", "y"]])
+def test_column_selection_resets_when_frame_columns_change(module_path, new_columns):
+    app = start_app(module_path)
+    app.session_state["columns"] = new_columns
+    app.run()
+
+    assert not app.exception
+    assert app.multiselect(key="preview_columns").value == new_columns
+    assert list(app.dataframe[0].value.columns) == new_columns
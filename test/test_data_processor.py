@@ -0,0 +1,23 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'klickt-test2'))
+
+from data_processor import (STUDENT_KEYWORD_TABLE, STUDENT_KEYWORDS,  # noqa: E402
+                            find_column_mapping)
+
+COLUMNS = ['Parent_ID', 'Student Name', 'Due Date']
+
+
+def test_find_column_mapping_accepts_raw_keywords():
+    assert find_column_mapping(COLUMNS, dict(STUDENT_KEYWORDS)) == {
+        'parentid': 'Parent_ID',
+        'Name': 'Student Name',
+        'Deadline': 'Due Date',
+    }
+
+
+def test_find_column_mapping_uses_precompiled_table():
+    assert find_column_mapping(COLUMNS, STUDENT_KEYWORDS, STUDENT_KEYWORD_TABLE) == \
+        find_column_mapping(COLUMNS, STUDENT_KEYWORDS)
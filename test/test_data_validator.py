@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))), 'klickt-test2'))
+
+from column_profiler import profile_columns  # noqa: E402
+from data_validator import GRADE_RE, invalid_amount, invalid_date, validate_sheets  # noqa: E402
+
+
+def test_invalid_amount_accepts_currency_formats():
+    values = pd.Series(['$136', '1,500 SAR', '2,250.50', '980 EGP', 'SAR 1500', 'EGP 980',
+                        'free', '-5'])
+    assert invalid_amount(values).tolist() == [False] * 6 + [True, True]
+
+
+def test_leading_currency_codes_are_profiled_as_money():
+    df = pd.DataFrame({'Fees': ['SAR 1500', 'EGP 980', 'USD 1,250.50', 'SAR 700'] * 10})
+    assert profile_columns(df) == {'Fees': 'money'}
+
+
+def test_invalid_date_accepts_mixed_formats():
+    values = pd.Series(['2024-09-01', '15/10/2024', 'March 3, 2024', 'soon'])
+    assert invalid_date(values).tolist() == [False, False, False, True]
+
+
+def test_invalid_date_handles_serials_mixed_with_text():
+    values = pd.Series(['01/02/2024', '2024-02-01', 'bad', 45536], dtype=object)
+    invalid = invalid_date(values)
+    assert invalid.dtype == bool
+    assert invalid.tolist() == [False, False, True, False]
+
+
+def test_grade_pattern_accepts_common_labels():
+    valid = ['5', 'G5', 'Year 7', 'KG1', '5th', '1st', '2nd', '3rd', '10th grade',
+             'Primary 3', 'Secondary 2', 'Grade 5A', 'Pre-K']
+    invalid = ['banana', 'fifth', '123']
+    assert all(GRADE_RE.fullmatch(grade) for grade in valid)
+    assert not any(GRADE_RE.fullmatch(grade) for grade in invalid)
+
+
+def test_invalid_date_checks_excel_serials():
+    values = pd.Series([45536, 45536.5, 12, 99999])
+    assert invalid_date(values).tolist() == [False, False, True, True]
+
+
+def test_validate_sheets_reports_excel_row_numbers():
+    payment_df = pd.DataFrame({'Amount': ['$10', 'n/a', '$30', 'unknown']},
+                              index=[4, 7, 9, 12])
+    report = validate_sheets({'Payment': payment_df})
+    assert report.to_dict('records') == [{
+        'Sheet': 'Payment',
+        'Column': 'Amount',
+        'Rule': 'Non-numeric or non-positive amount',
+        'Count': 2,
+        'Sample Excel Rows': '3, 5'
+    }]